@@ -8,10 +8,60 @@ from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Phase-specific prompt instructions, built once at import
+_PHASE_INSTRUCTIONS: Dict[str, str] = {
+    "specify": """
+Please execute the /specify command with the requirements in the user input below and create a comprehensive specification from your {role} perspective.
+
+Focus on:
+- Requirements and acceptance criteria relevant to your domain
+- Technical considerations specific to your expertise
+- Risks and dependencies you would identify
+- Implementation recommendations from your role's viewpoint
+
+Use the spek-kit /specify command to create the specification, then enhance it with your domain expertise.
+""",
+    "plan": """
+Please execute the /plan command and create a detailed implementation plan from your {role} perspective.
+
+Focus on:
+- Technical approach and architecture decisions in your domain
+- Implementation phases and dependencies you would manage
+- Resource requirements and team considerations
+- Risk mitigation strategies specific to your expertise
+
+Use the spek-kit /plan command to create the plan, then enhance it with your domain-specific insights.
+""",
+    "tasks": """
+Please execute the /tasks command and break down the work into actionable tasks from your {role} perspective.
+
+Focus on:
+- Granular tasks specific to your domain and expertise
+- Effort estimates and dependencies you would identify
+- Quality gates and acceptance criteria for your area
+- Team coordination and handoffs you would manage
+
+Use the spek-kit /tasks command to create the task breakdown, then enhance it with your role-specific considerations.
+""",
+}
+
 
 class AgentPersona:
     """Represents a single agent persona with configuration and prompts"""
 
+    __slots__ = (
+        "name",
+        "persona",
+        "role",
+        "expertise",
+        "system_message",
+        "data_sources",
+        "analysis_prompt",
+        "sample_knowledge",
+        "tools",
+        "_phase_prefixes",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.name = config.get("name", "")
         self.persona = config.get("persona", "")
@@ -22,61 +72,35 @@ class AgentPersona:
         self.analysis_prompt = config.get("analysisPrompt", {})
         self.sample_knowledge = config.get("sampleKnowledge", "")
         self.tools = config.get("tools", [])
+        # Static prompt prefix per phase, built on first use
+        self._phase_prefixes: Dict[str, str] = {}
 
     def get_spek_kit_prompt(self, phase: str, user_input: str) -> str:
         """Generate a spec-kit specific prompt for this agent persona"""
 
+        # Static persona and phase instructions come first and the user input
+        # last, so repeated prompts share a byte-identical prefix that provider
+        # prompt caching can reuse
+        prefix = self._phase_prefixes.get(phase)
+        if prefix is None:
+            prefix = self._phase_prefixes[phase] = self._build_phase_prefix(phase)
+        return prefix + f"\n---\nUser input: {user_input}\n"
+
+    def _build_phase_prefix(self, phase: str) -> str:
+        """Build the static part of the prompt for a phase (depends only on persona and phase)"""
         base_prompt = f"""You are {self.name}, {self.system_message}
 
 Your expertise areas: {', '.join(self.expertise)}
 
 You are working on a spec-driven development task using spek-kit.
 Current phase: /{phase}
-User input: {user_input}
-
-"""
 
-        if phase == "specify":
-            return base_prompt + f"""
-Please execute the /specify command with these requirements and create a comprehensive specification from your {self.role.lower()} perspective.
-
-Focus on:
-- Requirements and acceptance criteria relevant to your domain
-- Technical considerations specific to your expertise
-- Risks and dependencies you would identify
-- Implementation recommendations from your role's viewpoint
-
-Use the spek-kit /specify command to create the specification, then enhance it with your domain expertise.
-"""
-
-        elif phase == "plan":
-            return base_prompt + f"""
-Please execute the /plan command and create a detailed implementation plan from your {self.role.lower()} perspective.
-
-Focus on:
-- Technical approach and architecture decisions in your domain
-- Implementation phases and dependencies you would manage
-- Resource requirements and team considerations
-- Risk mitigation strategies specific to your expertise
-
-Use the spek-kit /plan command to create the plan, then enhance it with your domain-specific insights.
-"""
-
-        elif phase == "tasks":
-            return base_prompt + f"""
-Please execute the /tasks command and break down the work into actionable tasks from your {self.role.lower()} perspective.
-
-Focus on:
-- Granular tasks specific to your domain and expertise
-- Effort estimates and dependencies you would identify
-- Quality gates and acceptance criteria for your area
-- Team coordination and handoffs you would manage
-
-Use the spek-kit /tasks command to create the task breakdown, then enhance it with your role-specific considerations.
 """
 
-        else:
-            return base_prompt + f"Please help with the {phase} phase of this spec-driven development task."
+        instructions = _PHASE_INSTRUCTIONS.get(phase)
+        if instructions is None:
+            return base_prompt + f"Please help with the {phase} phase of this spec-driven development task.\n"
+        return base_prompt + instructions.format(role=self.role.lower())
 
 
 class AgentLoader:
@@ -156,23 +180,27 @@ class AgentLoader:
         return persona_key.lower().replace("_", "_")
 
 
-# Global instance for easy access
-agent_loader = AgentLoader()
+# Global instance for easy access, created on first use so importing this
+# module does not read and parse every persona file
+_agent_loader: Optional[AgentLoader] = None
 
 
 def get_agent_loader() -> AgentLoader:
     """Get the global agent loader instance"""
-    return agent_loader
+    global _agent_loader
+    if _agent_loader is None:
+        _agent_loader = AgentLoader()
+    return _agent_loader
 
 
 def list_available_agents() -> List[Dict[str, str]]:
     """Convenience function to list available agents"""
-    return agent_loader.list_agents()
+    return get_agent_loader().list_agents()
 
 
 def get_agent_prompt_for_phase(persona_key: str, phase: str, user_input: str) -> Optional[str]:
     """Convenience function to get agent prompt for spec-kit phase"""
-    return agent_loader.get_agent_prompt(persona_key, phase, user_input)
+    return get_agent_loader().get_agent_prompt(persona_key, phase, user_input)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ import json
 import logging
 import os
 import subprocess
-from pathlib import Path
-from typing import Dict, List, Optional
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -159,48 +160,72 @@ class GitIntegration:
         await self._run_git_command(["config", "--global", "pull.rebase", "false"])
 
     async def clone_repositories(self, workspace_dir: Path) -> Dict[str, Path]:
-        """Clone configured repositories to workspace"""
-        cloned_repos = {}
+        """Clone configured repositories to workspace concurrently"""
+        # Cap simultaneous clones so large repository lists don't saturate the
+        # network or trip Git host rate limits
+        limit = asyncio.Semaphore(max(1, int(os.getenv("GIT_CLONE_CONCURRENCY", "4"))))
 
-        for repo in self.repositories:
-            try:
-                url = repo.get("url")
-                branch = repo.get("branch", "main")
-                clone_path = repo.get("clonePath", "")
-
-                if not url:
-                    logger.warning("Repository URL not provided, skipping")
-                    continue
-
-                # Determine clone destination
-                if clone_path:
-                    dest_dir = workspace_dir / clone_path
-                else:
-                    # Extract repository name from URL
-                    repo_name = url.split("/")[-1].replace(".git", "")
-                    dest_dir = workspace_dir / repo_name
-
-                logger.info(f"Cloning repository: {url} -> {dest_dir}")
-
-                # Clone the repository
-                clone_result = await asyncio.create_subprocess_exec(
-                    "git", "clone", "--branch", branch, url, str(dest_dir),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await clone_result.communicate()
-
-                if clone_result.returncode == 0:
-                    logger.info(f"Successfully cloned {url} to {dest_dir}")
-                    cloned_repos[url] = dest_dir
-                else:
-                    logger.error(f"Failed to clone {url}: {stderr.decode()}")
-
-            except Exception as e:
-                logger.error(f"Error cloning repository {repo}: {e}")
+        async def clone(repo: Dict) -> Optional[Tuple[str, Path]]:
+            async with limit:
+                return await self._clone_repository(repo, workspace_dir)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(clone(repo)) for repo in self.repositories]
+
+        # Report results in configuration order regardless of completion order
+        cloned_repos = {}
+        for task in tasks:
+            result = task.result()
+            if result is not None:
+                url, dest_dir = result
+                cloned_repos[url] = dest_dir
 
         return cloned_repos
 
+    async def _clone_repository(self, repo: Dict, workspace_dir: Path) -> Optional[Tuple[str, Path]]:
+        """Clone a single repository, returning (url, destination) on success"""
+        try:
+            url = repo.get("url")
+            branch = repo.get("branch")
+            clone_path = repo.get("clonePath", "")
+
+            if not url:
+                logger.warning("Repository URL not provided, skipping")
+                return None
+
+            # Determine clone destination
+            if clone_path:
+                dest_dir = workspace_dir / clone_path
+            else:
+                # Extract repository name from the URL path, ignoring any
+                # query, fragment or trailing slash
+                repo_name = PurePosixPath(urlparse(url).path.rstrip("/")).name.removesuffix(".git")
+                dest_dir = workspace_dir / repo_name
+
+            logger.info(f"Cloning repository: {url} -> {dest_dir}")
+
+            # Clone the repository; without a configured branch, take the
+            # remote's default rather than guessing its name
+            branch_args = ["--branch", branch] if branch else []
+            clone_result = await asyncio.create_subprocess_exec(
+                "git", "clone", *branch_args, url, str(dest_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await clone_result.communicate()
+
+            if clone_result.returncode == 0:
+                logger.info(f"Successfully cloned {url} to {dest_dir}")
+                return url, dest_dir
+
+            logger.error(f"Failed to clone {url}: {stderr.decode()}")
+
+        except Exception as e:
+            # Contained here so one failed clone never cancels its siblings
+            logger.error(f"Error cloning repository {repo}: {e}")
+
+        return None
+
     async def create_and_push_branch(self, repo_path: Path, branch_name: str, commit_message: str) -> bool:
         """Create a new branch, commit changes, and push to remote"""
         try:
@@ -1,15 +1,30 @@
 #!/usr/bin/env python3
 
 from dataclasses import asdict
+import asyncio
 import logging
 import os
+import stat
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List
 
-from claude_code_sdk.types import StreamEvent, ResultMessage
+from claude_code_sdk.types import (
+    AssistantMessage,
+    ResultMessage,
+    StreamEvent,
+    SystemMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
 import requests
 from anthropic import Anthropic
 
@@ -17,10 +32,28 @@ from auth_handler import AuthHandler, BackendClient
 from git_integration import GitIntegration
 
 
-log_level = logging.DEBUG if os.getenv("DEBUG", "").lower() in ("true", "1", "yes") else logging.INFO
-logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stdout, force=True)
 logger = logging.getLogger(__name__)
 
+# SDK message and content block classes mapped to the type names the UI expects
+MESSAGE_TYPE_MAP: Dict[type, str] = {
+    AssistantMessage: "assistant_message",
+    UserMessage: "user_message",
+    SystemMessage: "system_message",
+    ResultMessage: "result_message",
+}
+CONTENT_TYPE_MAP: Dict[type, str] = {
+    TextBlock: "text_block",
+    ThinkingBlock: "thinking_block",
+    ToolUseBlock: "tool_use_block",
+    ToolResultBlock: "tool_result_block",
+}
+
+
+def configure_logging() -> None:
+    """Configure root logging for the runner process; called from main(), not at import."""
+    log_level = logging.DEBUG if os.getenv("DEBUG", "").lower() in ("true", "1", "yes") else logging.INFO
+    logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stdout, force=True)
+
 
 class SimpleClaudeRunner:
     def __init__(self) -> None:
@@ -46,8 +79,37 @@ class SimpleClaudeRunner:
         self.workdir = Path("/tmp/workdir")
         self.artifacts_dir = self.workdir / "artifacts"
         self.messages: List[Dict[str, Any]] = []
+        # Number of messages already written to the PVC proxy (messages are append-only)
+        self._flushed_count = 0
+        # JSON encoding of each message, reused across flushes
+        self._serialized_messages: List[str] = []
+        # Streaming flushes are coalesced to at most one per interval
+        self._flush_interval = float(os.getenv("MESSAGE_FLUSH_INTERVAL_SEC", "0.5"))
+        self._last_flush_at = 0.0
+        # Serializes flushes from the main thread and worker threads
+        self._flush_lock = threading.Lock()
+        # Deferred calls that pick up work skipped by a throttle, keyed by name
+        self._trailing_tasks: Dict[str, asyncio.Task] = {}
+        # Names of deferred calls asked for again while already pending
+        self._trailing_dirty: set[str] = set()
         # Track last pushed file state to send only deltas (path -> (mtime, size))
         self._last_push_index: Dict[str, tuple[float, int]] = {}
+        # Streaming workspace pushes rescan the whole workdir, so space them out
+        self._push_interval = float(os.getenv("WORKSPACE_PUSH_INTERVAL_SEC", "2.0"))
+        self._last_push_at = 0.0
+        # Serializes delta pushes from the main thread and worker threads
+        self._push_lock = threading.Lock()
+        # Event loop for synchronous status updates, created on first use
+        self._status_loop: asyncio.AbstractEventLoop | None = None
+        # Shared worker threads for overlapping PVC/backend HTTP round trips
+        io_workers = int(os.getenv("IO_POOL_WORKERS", "8"))
+        self._io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="runner-io")
+        # Keep-alive HTTP session for backend and PVC proxy calls, with a
+        # connection pool large enough for every I/O worker
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=io_workers)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
 
         if not self.session_name or not self.prompt or not self.api_key:
             missing = [k for k, v in {
@@ -122,22 +184,17 @@ class SimpleClaudeRunner:
             logger.warning(f"Title generation error: {e}")
             return self._fallback_display_name(prompt)
 
-    def _set_display_name_early(self) -> None:
-        """Generate and update the session display name as early as possible."""
+    def _set_display_name(self, display_name: str) -> None:
+        """Update the session display name on the backend."""
+        if not display_name:
+            return
         try:
-            display_name = self._generate_display_name_from_prompt(self.prompt)
-            if not display_name:
-                return
-            try:
-                import asyncio as _asyncio
-                _asyncio.run(self.backend.update_session_display_name(self.session_name, display_name))
-            except RuntimeError:
-                # Already in an event loop; skip to avoid crash
-                pass
-            except Exception as e:
-                logger.warning(f"Failed to set display name: {e}")
+            asyncio.run(self.backend.update_session_display_name(self.session_name, display_name))
+        except RuntimeError:
+            # Already in an event loop; skip to avoid crash
+            pass
         except Exception as e:
-            logger.debug(f"Skipping display name set: {e}")
+            logger.warning(f"Failed to set display name: {e}")
 
     def _inject_selected_agents(self) -> None:
         """Fetch selected agent persona markdown from backend and write to .claude/agents.
@@ -152,13 +209,15 @@ class SimpleClaudeRunner:
             base = f"{self.backend_api_url}/projects/{self.session_namespace}/agents"
             out_dir = self.workdir / ".claude" / "agents"
             out_dir.mkdir(parents=True, exist_ok=True)
-            for p in personas:
+            headers = self._auth_headers()
+
+            def inject(p: str) -> None:
                 try:
                     url = f"{base}/{p}/markdown"
-                    resp = requests.get(url, headers=self._auth_headers(), timeout=20)
+                    resp = self._http.get(url, headers=headers, timeout=20)
                     if resp.status_code != 200:
                         logger.warning(f"Agent markdown fetch failed for {p}: HTTP {resp.status_code}")
-                        continue
+                        return
                     content = resp.text or ""
                     # Write to working dir for runner/Claude
                     local_path = out_dir / f"{p}.md"
@@ -169,6 +228,9 @@ class SimpleClaudeRunner:
                     logger.info(f"Injected agent persona: {p}")
                 except Exception as e:  # noqa: BLE001
                     logger.warning(f"Failed injecting agent {p}: {e}")
+
+            # Each persona is two independent HTTP round trips; overlap them
+            list(self._io_pool.map(inject, personas))
         except Exception as e:  # noqa: BLE001
             logger.debug(f"Skipping agent injection: {e}")
 
@@ -180,7 +242,7 @@ class SimpleClaudeRunner:
         url = f"{self.pvc_proxy_api_url}/content/write"
         body = {"path": path, "content": content, "encoding": encoding}
         try:
-            resp = requests.post(url, headers={**self._auth_headers(), "Content-Type": "application/json"}, data=json.dumps(body), timeout=30)
+            resp = self._http.post(url, headers={**self._auth_headers(), "Content-Type": "application/json"}, data=json.dumps(body), timeout=30)
             if resp.status_code // 100 == 2:
                 return True
             logger.error(f"content_write failed for {path}: HTTP {resp.status_code}")
@@ -191,7 +253,7 @@ class SimpleClaudeRunner:
     def content_read(self, path: str) -> bytes:
         url = f"{self.pvc_proxy_api_url}/content/file"
         try:
-            resp = requests.get(url, headers=self._auth_headers(), params={"path": path}, timeout=30)
+            resp = self._http.get(url, headers=self._auth_headers(), params={"path": path}, timeout=30)
             if resp.status_code == 200:
                 return resp.content
         except Exception as e:
@@ -201,7 +263,7 @@ class SimpleClaudeRunner:
     def content_list(self, path: str) -> List[Dict[str, Any]]:
         url = f"{self.pvc_proxy_api_url}/content/list"
         try:
-            resp = requests.get(url, headers=self._auth_headers(), params={"path": path}, timeout=30)
+            resp = self._http.get(url, headers=self._auth_headers(), params={"path": path}, timeout=30)
             if resp.status_code == 200:
                 return resp.json().get("items", [])
         except Exception as e:
@@ -217,25 +279,25 @@ class SimpleClaudeRunner:
         logger.info(f"Starting workspace sync from PVC: {self.workspace_store_path} -> {self.workdir}")
         
         def pull_dir(pvc_path: str, dst: Path) -> None:
-            logger.debug(f"Pulling directory: {pvc_path} -> {dst}")
+            logger.debug("Pulling directory: %s -> %s", pvc_path, dst)
             dst.mkdir(parents=True, exist_ok=True)
             items = self.content_list(pvc_path)
-            logger.debug(f"Found {len(items)} items in {pvc_path}")
+            logger.debug("Found %d items in %s", len(items), pvc_path)
             
             for it in items:
                 p = it.get("path", "")
                 name = Path(p).name
                 target = dst / name
                 if it.get("isDir"):
-                    logger.debug(f"Recursively pulling directory: {p}")
+                    logger.debug("Recursively pulling directory: %s", p)
                     pull_dir(p, target)
                 else:
                     try:
-                        logger.debug(f"Pulling file: {p} -> {target}")
+                        logger.debug("Pulling file: %s -> %s", p, target)
                         data = self.content_read(p) or b""
                         target.parent.mkdir(parents=True, exist_ok=True)
                         target.write_bytes(data)
-                        logger.debug(f"Successfully pulled file: {p} ({len(data)} bytes)")
+                        logger.debug("Successfully pulled file: %s (%d bytes)", p, len(data))
                     except Exception as e:
                         logger.warning(f"Failed to pull file {p} -> {target}: {e}")
         
@@ -245,20 +307,26 @@ class SimpleClaudeRunner:
     def _push_workspace_to_pvc(self) -> None:
         if not self.workspace_store_path:
             return
-        for path in self.workdir.rglob("*"):
-            if path.is_dir():
-                        continue
-            rel = path.relative_to(self.workdir)
-            pvc_path = str(Path(self.workspace_store_path) / rel)
+        self._push_files([path for path in self.workdir.rglob("*") if not path.is_dir()])
+
+    def _push_file(self, path: Path) -> None:
+        rel = path.relative_to(self.workdir)
+        pvc_path = str(Path(self.workspace_store_path) / rel)
+        try:
+            content = path.read_text(encoding="utf-8")
+            self.content_write(pvc_path, content, "utf8")
+        except Exception:
             try:
-                content = path.read_text(encoding="utf-8")
-                self.content_write(pvc_path, content, "utf8")
-            except Exception:
-                try:
-                    import base64
-                    self.content_write(pvc_path, base64.b64encode(path.read_bytes()).decode("ascii"), "base64")
-                except Exception as e:
-                    logger.warning(f"Failed to push file {path} -> {pvc_path}: {e}")
+                import base64
+                self.content_write(pvc_path, base64.b64encode(path.read_bytes()).decode("ascii"), "base64")
+            except Exception as e:
+                logger.warning(f"Failed to push file {path} -> {pvc_path}: {e}")
+
+    def _push_files(self, paths: List[Path]) -> None:
+        """Upload workspace files to the PVC proxy, overlapping the per-file round trips."""
+        if not paths:
+            return
+        list(self._io_pool.map(self._push_file, paths))
 
     # ---------------- Messaging ----------------
     def _append_message(self, message: str) -> None:
@@ -271,14 +339,69 @@ class SimpleClaudeRunner:
         self._flush_messages()
 
     def _flush_messages(self) -> None:
-        try:
-            payload = json.dumps(self.messages)
-            ok = self.content_write(self.message_store_path, payload, encoding="utf8")
-            if not ok:
-                logger.warning("Failed to write messages to PVC proxy")
-            logger.info(f"Flushed {len(self.messages)} messages to PVC proxy")
-        except Exception as e:
-            logger.warning(f"Failed to flush messages: {e}")
+        with self._flush_lock:
+            count = len(self.messages)
+            if count == self._flushed_count:
+                # Nothing new since the last successful write
+                return
+            try:
+                # Only encode messages added since the previous flush; the joined
+                # result is identical to json.dumps(self.messages)
+                for message in self.messages[len(self._serialized_messages):count]:
+                    self._serialized_messages.append(json.dumps(message))
+                payload = "[" + ", ".join(self._serialized_messages) + "]"
+                # Throttle from when the write starts, so calls made during a
+                # slow write are coalesced rather than queued right behind it
+                self._last_flush_at = time.monotonic()
+                ok = self.content_write(self.message_store_path, payload, encoding="utf8")
+                if not ok:
+                    logger.warning("Failed to write messages to PVC proxy")
+                    return
+                self._flushed_count = count
+                logger.info(f"Flushed {count} messages to PVC proxy")
+            except Exception as e:
+                logger.warning(f"Failed to flush messages: {e}")
+
+    async def _flush_messages_async(self, force: bool = False) -> None:
+        """Flush from a coroutine without blocking the event loop on serialization and I/O.
+
+        Unless forced, a flush within MESSAGE_FLUSH_INTERVAL_SEC of the previous one is
+        deferred to the end of that interval, so bursts coalesce into one write without
+        leaving the latest messages unwritten.
+        """
+        remaining = self._flush_interval - (time.monotonic() - self._last_flush_at)
+        if not force and (remaining > 0 or self._trailing_pending("flush")):
+            self._schedule_trailing("flush", max(remaining, 0.0), self._flush_interval, self._flush_messages)
+            return
+        await asyncio.to_thread(self._flush_messages)
+
+    def _trailing_pending(self, name: str) -> bool:
+        """Whether a deferred call under name is still waiting or running."""
+        pending = self._trailing_tasks.get(name)
+        return pending is not None and not pending.done()
+
+    def _schedule_trailing(self, name: str, delay: float, interval: float, func) -> None:
+        """Run func on a worker thread after delay.
+
+        Requests made while a call under the same name is pending are folded
+        into it; one made after that call has started running triggers a single
+        rerun interval seconds later, so nothing requested is left undone.
+        """
+        if self._trailing_pending(name):
+            self._trailing_dirty.add(name)
+            return
+
+        async def trailing() -> None:
+            wait = delay
+            while True:
+                await asyncio.sleep(wait)
+                self._trailing_dirty.discard(name)
+                await asyncio.to_thread(func)
+                if name not in self._trailing_dirty:
+                    return
+                wait = interval
+
+        self._trailing_tasks[name] = asyncio.get_running_loop().create_task(trailing())
 
     # ---------------- Chat inbox helpers ----------------
     async def _read_inbox_lines(self, last_offset: int) -> tuple[list[dict[str, Any]], int]:
@@ -317,44 +440,50 @@ class SimpleClaudeRunner:
             logger.debug(f"read inbox error: {e}")
             return [], last_offset
 
-    def _push_workspace_deltas(self) -> None:
-        """Mirror only changed/new files from workdir to PVC path."""
-        try:
-            if not self.workspace_store_path:
-                return
-            updated_index: Dict[str, tuple[float, int]] = {}
-            files_to_push: list[Path] = []
-            for path in self.workdir.rglob("*"):
-                if path.is_dir():
-                    continue
-                try:
-                    st = path.stat()
-                    mtime = st.st_mtime
-                    size = st.st_size
-                    rel = str(path.relative_to(self.workdir))
-                    updated_index[rel] = (mtime, size)
-                    prev = self._last_push_index.get(rel)
-                    if prev is None or prev[0] != mtime or prev[1] != size:
-                        files_to_push.append(path)
-                except Exception:
-                    continue
+    def _push_workspace_deltas(self, force: bool = False) -> None:
+        """Mirror only changed/new files from workdir to PVC path.
 
-            for path in files_to_push:
-                rel = path.relative_to(self.workdir)
-                pvc_path = str(Path(self.workspace_store_path) / rel)
+        Unless force is set, a call within WORKSPACE_PUSH_INTERVAL_SEC of the
+        previous push is deferred to the end of that interval when called with
+        an event loop running, so changes are never left unmirrored.
+        """
+        if not self.workspace_store_path:
+            return
+        if not force:
+            remaining = self._push_interval - (time.monotonic() - self._last_push_at)
+            if remaining > 0 or self._trailing_pending("push"):
                 try:
-                    content = path.read_text(encoding="utf-8")
-                    self.content_write(pvc_path, content, "utf8")
-                except Exception:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return
+                self._schedule_trailing("push", max(remaining, 0.0), self._push_interval, lambda: self._push_workspace_deltas(force=True))
+                return
+        with self._push_lock:
+            try:
+                self._last_push_at = time.monotonic()
+                updated_index: Dict[str, tuple[float, int]] = {}
+                files_to_push: list[Path] = []
+                for path in self.workdir.rglob("*"):
                     try:
-                        import base64
-                        self.content_write(pvc_path, base64.b64encode(path.read_bytes()).decode("ascii"), "base64")
-                    except Exception as e:
-                        logger.warning(f"Failed to push file {path} -> {pvc_path}: {e}")
+                        # One stat per entry serves both the directory check and the delta index
+                        st = path.stat()
+                        if stat.S_ISDIR(st.st_mode):
+                            continue
+                        mtime = st.st_mtime
+                        size = st.st_size
+                        rel = str(path.relative_to(self.workdir))
+                        updated_index[rel] = (mtime, size)
+                        prev = self._last_push_index.get(rel)
+                        if prev is None or prev[0] != mtime or prev[1] != size:
+                            files_to_push.append(path)
+                    except Exception:
+                        continue
 
-            self._last_push_index = updated_index
-        except Exception as e:
-            logger.debug(f"push deltas failed: {e}")
+                self._push_files(files_to_push)
+
+                self._last_push_index = updated_index
+            except Exception as e:
+                logger.debug(f"push deltas failed: {e}")
 
     async def _chat_mode(self) -> None:
         from claude_code_sdk import (
@@ -377,7 +506,8 @@ class SimpleClaudeRunner:
             permission_mode=os.getenv("CLAUDE_PERMISSION_MODE", "acceptEdits"),
             allowed_tools=allowed_tools if allowed_tools else None,
             cwd=str(self.workdir),
-            append_system_prompt=self.prompt + "\n\nALWAYS consult sub agents to help with this task.",
+            # Static guidance first so the system prompt prefix stays cacheable across sessions
+            append_system_prompt="ALWAYS consult sub agents to help with this task.\n\n" + self.prompt,
         )
 
         # Restore cursor if present
@@ -425,19 +555,13 @@ class SimpleClaudeRunner:
                             "content": text,
                             "timestamp": datetime.now(timezone.utc).isoformat(),
                         })
-                        self._flush_messages()
+                        await self._flush_messages_async(force=True)
 
                         # Send to Claude and stream results
                         await client.query(text)
                         async for message in client.receive_response():
                             logger.info(f"Message: {message}")
-                            message_type_map = {
-                                AssistantMessage: "assistant_message",
-                                UserMessage: "user_message",
-                                SystemMessage: "system_message",
-                                ResultMessage: "result_message",
-                            }
-                            message_type = message_type_map.get(type(message), "unknown_message")
+                            message_type = MESSAGE_TYPE_MAP.get(type(message), "unknown_message")
                             if isinstance(message, AssistantMessage) or isinstance(message, UserMessage):
                                 if isinstance(message.content, str):
                                     payload = {
@@ -446,16 +570,9 @@ class SimpleClaudeRunner:
                                         "timestamp": datetime.now(timezone.utc).isoformat(),
                                     }
                                     self.messages.append(payload)
-                                    self._flush_messages()
                                 else:
                                     for block in message.content:
-                                        content_type_map = {
-                                            TextBlock: "text_block",
-                                            ThinkingBlock: "thinking_block",
-                                            ToolUseBlock: "tool_use_block",
-                                            ToolResultBlock: "tool_result_block",
-                                        }
-                                        content_type = content_type_map.get(type(block), "unknown_block")
+                                        content_type = CONTENT_TYPE_MAP.get(type(block), "unknown_block")
                                         payload = {
                                             "type": message_type,
                                             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -465,7 +582,6 @@ class SimpleClaudeRunner:
                                             },
                                         }
                                         self.messages.append(payload)
-                                        self._flush_messages()
                             else:
                                 payload = {
                                     "type": message_type,
@@ -473,17 +589,15 @@ class SimpleClaudeRunner:
                                     **asdict(message),
                                 }
                                 self.messages.append(payload)
+                            # One write per SDK message, covering all of its content blocks
+                            await self._flush_messages_async()
                         
                         # Ensure any recent local changes are visible in UI before next run (deltas only)
                         try:
-                            self._push_workspace_deltas()
-                        except Exception:
-                            await _push_workspace_async()
-                        try:
-                            self._push_workspace_deltas()
+                            self._push_workspace_deltas(force=True)
                         except Exception:
                             await _push_workspace_async()
-                        self._flush_messages()
+                        await self._flush_messages_async(force=True)
 
                     # Commit cursor
                     last_offset = new_offset
@@ -496,7 +610,8 @@ class SimpleClaudeRunner:
        
 
     # ---------------- Status ----------------
-    def _update_status(self, phase: str, message: str | None = None, completed: bool = False, result_msg: ResultMessage | None = None) -> None:
+    @staticmethod
+    def _build_status_payload(phase: str, message: str | None = None, completed: bool = False, result_msg: ResultMessage | None = None) -> Dict[str, Any]:
         payload: Dict[str, Any] = {"phase": phase}
         if message:
             payload["message"] = message
@@ -509,17 +624,19 @@ class SimpleClaudeRunner:
             payload["session_id"] = result_msg.session_id
             payload["total_cost_usd"] = result_msg.total_cost_usd
             payload["usage"] = result_msg.usage
-      
+
         if completed:
             payload["completionTime"] = datetime.now(timezone.utc).isoformat()
+        return payload
+
+    def _update_status(self, phase: str, message: str | None = None, completed: bool = False, result_msg: ResultMessage | None = None) -> None:
+        payload = self._build_status_payload(phase, message, completed, result_msg)
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.backend.update_session_status(self.session_name, payload))
-            finally:
-                loop.close()
+            # Status updates happen throughout the run; reuse one private loop
+            # for them instead of creating and closing a loop per update
+            if self._status_loop is None:
+                self._status_loop = asyncio.new_event_loop()
+            self._status_loop.run_until_complete(self.backend.update_session_status(self.session_name, payload))
         except RuntimeError:
             # already in event loop
             pass
@@ -528,21 +645,7 @@ class SimpleClaudeRunner:
 
 
     async def update_status_async(self, phase: str, message: str | None = None, completed: bool = False, result_msg: ResultMessage | None = None) -> None:
-        payload: Dict[str, Any] = {"phase": phase}
-        if message:
-            payload["message"] = message
-
-        if result_msg:
-            payload["result"] = result_msg.result
-            payload["subtype"] = result_msg.subtype
-            payload["is_error"] = result_msg.is_error
-            payload["num_turns"] = result_msg.num_turns
-            payload["session_id"] = result_msg.session_id
-            payload["total_cost_usd"] = result_msg.total_cost_usd
-            payload["usage"] = result_msg.usage
-
-        if completed:
-            payload["completionTime"] = datetime.now(timezone.utc).isoformat()
+        payload = self._build_status_payload(phase, message, completed, result_msg)
         try:
             await self.backend.update_session_status(self.session_name, payload)
         except Exception as e:
@@ -591,13 +694,7 @@ class SimpleClaudeRunner:
                         # handle stream events
                         pass
                     else:
-                        message_type_map = {
-                            AssistantMessage: "assistant_message",
-                            UserMessage: "user_message",
-                            SystemMessage: "system_message",
-                            ResultMessage: "result_message",
-                        }
-                        message_type = message_type_map.get(type(message), "unknown_message")
+                        message_type = MESSAGE_TYPE_MAP.get(type(message), "unknown_message")
                         if isinstance(message, AssistantMessage) or isinstance(message, UserMessage):
                             if isinstance(message.content, str):
                                 payload = {
@@ -608,13 +705,7 @@ class SimpleClaudeRunner:
                                 self.messages.append(payload)
                             else:
                                 for block in message.content:
-                                    content_type_map = {
-                                        TextBlock: "text_block",
-                                        ThinkingBlock: "thinking_block",
-                                        ToolUseBlock: "tool_use_block",
-                                        ToolResultBlock: "tool_result_block",
-                                    }
-                                    content_type = content_type_map.get(type(block), "unknown_block")
+                                    content_type = CONTENT_TYPE_MAP.get(type(block), "unknown_block")
                                     payload = {
                                         "type": message_type,
                                         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -639,7 +730,7 @@ class SimpleClaudeRunner:
                         self._push_workspace_deltas()
                     except Exception:
                         logger.warning("Failed to push workspace deltas")
-                    self._flush_messages()
+                    await self._flush_messages_async()
                     
             except GeneratorExit:
                 logger.debug("Stream generator closed (GeneratorExit)")
@@ -694,15 +785,26 @@ class SimpleClaudeRunner:
 
             self._update_status("Running", message="Initializing session")
 
-            # Update display name immediately based on the prompt
-            self._set_display_name_early()
+            # Generate the display name (an LLM round trip) in the background while
+            # the workspace syncs from the PVC
+            display_name_future = self._io_pool.submit(self._generate_display_name_from_prompt, self.prompt)
 
             # 1) Sync shared workspace from PVC (if configured)
             self._update_status("Running", message="Syncing workspace from PVC")
             self._sync_workspace_from_pvc()
 
+            # Publish the display name from this thread so the update never
+            # races the status updates on the same session resource; fall back
+            # to the prompt-derived name if generation is slow or fails
             try:
-                self._push_workspace_deltas()
+                display_name = display_name_future.result(timeout=30)
+            except Exception as e:
+                logger.warning(f"Display name generation failed, using fallback: {e}")
+                display_name = self._fallback_display_name(self.prompt)
+            self._set_display_name(display_name)
+
+            try:
+                self._push_workspace_deltas(force=True)
             except Exception:
                 logger.warning("Failed to push workspace deltas")
 
@@ -720,7 +822,6 @@ class SimpleClaudeRunner:
                 # If an event loop is already running, skip async setup to avoid crash
                 pass
 
-
             # Chat vs headless mode
             chat_enabled = os.getenv("INTERACTIVE", "").lower() in ("true", "1", "yes")
             if chat_enabled:
@@ -770,9 +871,14 @@ class SimpleClaudeRunner:
             logger.error(f"Session failed: {e}")
             self._update_status("Failed", message=str(e), completed=True)
             return 1
+        finally:
+            if self._status_loop is not None:
+                self._status_loop.close()
+                self._status_loop = None
 
 
 def main() -> None:
+    configure_logging()
     try:
         rc = SimpleClaudeRunner().run()
         sys.exit(rc)
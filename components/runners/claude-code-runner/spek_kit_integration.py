@@ -7,6 +7,7 @@ import re
 import shutil
 import subprocess
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 import httpx
@@ -15,6 +16,23 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Spek-kit commands in detection priority order, each matching /command
+# followed by space and arguments; compiled once at import
+_SPEK_COMMAND_PATTERNS = tuple(
+    (command, re.compile(rf'^/{command}\s+(.+?)(?:\n|$)', re.MULTILINE | re.DOTALL))
+    for command in ("specify", "plan", "tasks")
+)
+
+# Artifact suffixes reported as text, and the subset whose content is inlined
+_TEXT_SUFFIXES = frozenset({".md", ".txt", ".json", ".yaml", ".yml"})
+_INLINE_SUFFIXES = frozenset({".md", ".txt", ".json"})
+
+
+def _timestamp() -> str:
+    """Local wall-clock time in `date`'s default format, without spawning a shell"""
+    return datetime.now().astimezone().strftime("%a %b %e %H:%M:%S %Z %Y")
+
+
 class SpekKitIntegration:
     """Integration layer for spek-kit with claude-runner"""
 
@@ -89,12 +107,10 @@ class SpekKitIntegration:
             Tuple of (command, arguments) if found, None otherwise
         """
         # Look for spek-kit commands at the start of the prompt
-        spek_commands = ["specify", "plan", "tasks"]
+        text = prompt.strip()
 
-        for command in spek_commands:
-            # Match /command followed by space and arguments
-            pattern = rf'^/{command}\s+(.+?)(?:\n|$)'
-            match = re.search(pattern, prompt.strip(), re.MULTILINE | re.DOTALL)
+        for command, pattern in _SPEK_COMMAND_PATTERNS:
+            match = pattern.search(text)
             if match:
                 args = match.group(1).strip()
                 logger.info(f"Detected spek-kit command: /{command} with args: {args[:100]}...")
@@ -301,7 +317,7 @@ Follow the spek-kit workflow:
 
 ## Generated by
 Spek-kit integration in claude-runner
-Timestamp: {os.popen('date').read().strip()}
+Timestamp: {_timestamp()}
 """
 
     def _generate_plan_content(self, tech_requirements: str) -> str:
@@ -351,7 +367,7 @@ Timestamp: {os.popen('date').read().strip()}
 
 ## Generated by
 Spek-kit integration in claude-runner
-Timestamp: {os.popen('date').read().strip()}
+Timestamp: {_timestamp()}
 """
 
     def _generate_tasks_content(self, task_details: str) -> str:
@@ -402,7 +418,7 @@ Timestamp: {os.popen('date').read().strip()}
 
 ## Generated by
 Spek-kit integration in claude-runner
-Timestamp: {os.popen('date').read().strip()}
+Timestamp: {_timestamp()}
 """
 
     def get_project_artifacts(self) -> Dict[str, Any]:
@@ -422,11 +438,11 @@ Timestamp: {os.popen('date').read().strip()}
                         artifacts["files"].append({
                             "path": rel_path,
                             "size": file_path.stat().st_size,
-                            "type": "text" if file_path.suffix in [".md", ".txt", ".json", ".yaml", ".yml"] else "binary"
+                            "type": "text" if file_path.suffix in _TEXT_SUFFIXES else "binary"
                         })
 
                         # Read content for text files
-                        if file_path.suffix in [".md", ".txt", ".json"]:
+                        if file_path.suffix in _INLINE_SUFFIXES:
                             try:
                                 content = file_path.read_text()
                                 artifacts["structure"][rel_path] = content
@@ -23,7 +23,8 @@ from .validation import (
     MCPEndpointValidator,
     MCPConfigurationValidator,
     MCPSecurityValidator,
-    ValidationResult
+    ValidationResult,
+    parse_mcp_servers
 )
 
 # Error handling
@@ -67,6 +68,7 @@ __all__ = [
     "MCPConfigurationValidator",
     "MCPSecurityValidator",
     "ValidationResult",
+    "parse_mcp_servers",
     
     # Error handling
     "MCPError",
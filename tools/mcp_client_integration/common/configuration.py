@@ -12,7 +12,13 @@ import logging
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 
-from .validation import MCPConfigurationValidator, MCPSecurityValidator, ValidationResult
+from .validation import (
+    MCPConfigurationValidator,
+    MCPSecurityValidator,
+    ValidationResult,
+    parse_mcp_servers
+)
+from .serialization import JSONDecodeError
 from .error_handler import MCPConfigurationError, handle_mcp_errors
 
 # Configure logging
@@ -139,10 +145,9 @@ class MCPConfigurationManager:
         
         # Parse JSON configuration (async-safe)
         try:
-            # Use json.loads which is CPU-bound but fast for config sizes
-            # For very large configs, could use asyncio.to_thread in future
-            config_data = json.loads(env_value)
-        except json.JSONDecodeError as e:
+            # Reuses the document already parsed (and cached) during validation
+            config_data = parse_mcp_servers(env_value)
+        except JSONDecodeError as e:
             raise MCPConfigurationError(f"Invalid JSON in {env_var}: {e}")
         
         # Convert to MCPConfiguration
@@ -195,7 +200,8 @@ class MCPConfigurationManager:
                     timeout=endpoint.get("timeout", self.default_timeout),
                     connection_type=endpoint.get("connection_type"),
                     enabled=endpoint.get("enabled", True),
-                    metadata=endpoint.get("metadata")
+                    # Copy so configs never alias the cached parsed document
+                    metadata=dict(endpoint["metadata"]) if endpoint.get("metadata") is not None else None
                 )
             else:
                 raise MCPConfigurationError(
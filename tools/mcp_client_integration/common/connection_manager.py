@@ -7,10 +7,11 @@ eliminating code duplication and providing consistent connection lifecycle manag
 """
 
 import asyncio
+import itertools
 import logging
 import ssl
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Union
 from urllib.parse import urlparse
 
 # Configure logging
@@ -43,6 +44,21 @@ class MCPConnectionInterface(ABC):
         """
         pass
     
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several messages as a single exchange.
+        
+        Transports that support JSON-RPC batch arrays override this to put all
+        messages on the wire at once. The default sends them one at a time.
+        
+        Args:
+            messages: The messages to send
+        
+        Returns:
+            Responses in the same order as the messages
+        """
+        return [await self.send_message(message) for message in messages]
+    
     @abstractmethod
     async def close(self) -> None:
         """
@@ -95,7 +111,10 @@ class MockMCPConnection(MCPConnectionInterface):
         self._endpoint = endpoint
         self._connected = True
         self._simulate_failure = simulate_failure
-        self._message_count = 0
+        self._exchange_count = 0
+        
+        # Correlation IDs only need to be unique per connection, so use small ints
+        self._next_id = itertools.count(1).__next__
         
         logger.debug(f"Created mock connection to {endpoint}")
     
@@ -107,18 +126,35 @@ class MockMCPConnection(MCPConnectionInterface):
         if not self._connected:
             raise ConnectionError("Connection is not active")
         
-        self._message_count += 1
+        self._exchange_count += 1
+        return self._build_response(message)
+    
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send a batch of messages through mock connection as one exchange."""
+        if self._simulate_failure:
+            raise ConnectionError("Simulated connection failure")
+        
+        if not self._connected:
+            raise ConnectionError("Connection is not active")
+        
+        self._exchange_count += 1
+        logger.debug(f"Mock connection sent batch of {len(messages)} messages to {self._endpoint}")
+        return [self._build_response(message) for message in messages]
+    
+    def _build_response(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the simulated response for a single message."""
+        message_id = self._next_id()
         
         # Simulate message processing
         response = {
             "status": "ok",
             "endpoint": self._endpoint,
-            "message_id": self._message_count,
+            "message_id": message_id,
             "echo": message,
             "timestamp": asyncio.get_event_loop().time()
         }
         
-        logger.debug(f"Mock connection sent message {self._message_count} to {self._endpoint}")
+        logger.debug(f"Mock connection sent message {message_id} to {self._endpoint}")
         return response
     
     async def close(self) -> None:
@@ -137,12 +173,72 @@ class MockMCPConnection(MCPConnectionInterface):
         """Get mock connection endpoint."""
         return self._endpoint
     
+    @property
+    def exchange_count(self) -> int:
+        """Number of outbound exchanges (single messages or batches) sent."""
+        return self._exchange_count
+    
     def set_failure_mode(self, simulate_failure: bool) -> None:
         """Set whether to simulate failures."""
         self._simulate_failure = simulate_failure
 
 
-class ExternalRouteMCPConnection(MCPConnectionInterface):
+class _SimulatedTransportMCPConnection(MCPConnectionInterface):
+    """
+    Shared batch exchange for the transport-backed connections.
+    
+    The external route and cluster service connections differ only in the
+    connection type reported on each reply, which subclasses set as
+    _connection_type. Subclasses keep _endpoint, _connected and _next_id.
+    """
+    
+    _connection_type: str
+    
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send a batch of messages as one exchange.
+        
+        In a real implementation, this would send one JSON-RPC batch array over
+        the connection's transport.
+        
+        Args:
+            messages: The messages to send
+        
+        Returns:
+            Responses in the same order as the messages
+        
+        Raises:
+            ConnectionError: If the connection is not established or the send fails
+        """
+        if not self._connected:
+            raise ConnectionError("Connection not established")
+        
+        label = self._connection_type.replace("_", " ")
+        try:
+            timestamp = asyncio.get_event_loop().time()
+            # The simulated transport replies in request order; a real one would
+            # match replies to requests by their "id"
+            responses = [
+                {
+                    "id": self._next_id(),
+                    "status": "ok",
+                    "endpoint": self._endpoint,
+                    "type": self._connection_type,
+                    "message": message,
+                    "timestamp": timestamp
+                }
+                for message in messages
+            ]
+            
+            logger.debug(f"Sent batch of {len(messages)} messages via {label} to {self._endpoint}")
+            return responses
+        
+        except Exception as e:
+            logger.error(f"Failed to send batch to {self._endpoint}: {e}")
+            raise ConnectionError(f"Batch send failed: {e}")
+
+
+class ExternalRouteMCPConnection(_SimulatedTransportMCPConnection):
     """
     MCP connection for external routes (HTTPS/SSE).
     
@@ -150,6 +246,8 @@ class ExternalRouteMCPConnection(MCPConnectionInterface):
     HTTPS routes, typically used in OpenShift environments.
     """
     
+    _connection_type = "external_route"
+    
     def __init__(self, endpoint: str, timeout: int = 30, verify_ssl: bool = True):
         """
         Initialize external route connection.
@@ -164,6 +262,7 @@ class ExternalRouteMCPConnection(MCPConnectionInterface):
         self._verify_ssl = verify_ssl
         self._connected = False
         self._session = None
+        self._next_id = itertools.count(1).__next__
         
         # Validate endpoint format
         parsed = urlparse(endpoint)
@@ -208,6 +307,7 @@ class ExternalRouteMCPConnection(MCPConnectionInterface):
             # In a real implementation, this would send via HTTPS/SSE
             # For now, we simulate a successful message exchange
             response = {
+                "id": self._next_id(),
                 "status": "ok",
                 "endpoint": self._endpoint,
                 "type": "external_route",
@@ -242,7 +342,7 @@ class ExternalRouteMCPConnection(MCPConnectionInterface):
         return self._endpoint
 
 
-class ClusterServiceMCPConnection(MCPConnectionInterface):
+class ClusterServiceMCPConnection(_SimulatedTransportMCPConnection):
     """
     MCP connection for cluster-internal services.
     
@@ -250,6 +350,8 @@ class ClusterServiceMCPConnection(MCPConnectionInterface):
     Kubernetes services within the same cluster.
     """
     
+    _connection_type = "cluster_service"
+    
     def __init__(self, endpoint: str, timeout: int = 30):
         """
         Initialize cluster service connection.
@@ -262,6 +364,7 @@ class ClusterServiceMCPConnection(MCPConnectionInterface):
         self._timeout = timeout
         self._connected = False
         self._websocket = None
+        self._next_id = itertools.count(1).__next__
         
         # Parse cluster service format
         if '.svc.cluster.local' not in endpoint:
@@ -289,6 +392,7 @@ class ClusterServiceMCPConnection(MCPConnectionInterface):
             # In a real implementation, this would send via WebSocket
             # For now, we simulate a successful message exchange
             response = {
+                "id": self._next_id(),
                 "status": "ok",
                 "endpoint": self._endpoint,
                 "type": "cluster_service",
@@ -400,20 +504,36 @@ class MCPConnectionPool:
     eliminating the need for each component to manage connections individually.
     """
     
-    def __init__(self, timeout: int = 30, max_connections: int = 10):
+    def __init__(
+        self, 
+        timeout: int = 30, 
+        max_connections: int = 10,
+        max_concurrent_requests: Optional[int] = None
+    ):
         """
         Initialize connection pool.
         
         Args:
             timeout: Default connection timeout
             max_connections: Maximum number of connections allowed
+            max_concurrent_requests: Maximum number of in-flight exchanges across
+                all connections (None for no limit)
         """
         self._connections: Dict[str, MCPConnectionInterface] = {}
-        self._health: Dict[str, bool] = {}
+        # Set while a connection is healthy, so callers can await recovery
+        self._health_events: Dict[str, asyncio.Event] = {}
         self._timeout = timeout
         self._max_connections = max_connections
         self._connection_count = 0
         
+        # Admission control uses an explicit counter guarded by a condition so the
+        # limit can be resized at runtime; the condition belongs to the loop it
+        # was created in and is rebuilt if the pool is used from another loop
+        self._max_concurrent_requests = max_concurrent_requests
+        self._active_requests = 0
+        self._request_slots: Optional[asyncio.Condition] = None
+        self._request_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         logger.debug(f"Initialized MCP connection pool (max_connections={max_connections})")
     
     async def add_connection(
@@ -450,7 +570,7 @@ class MCPConnectionPool:
                 await connection.connect()
             
             self._connections[capability] = connection
-            self._health[capability] = True
+            self._set_health(capability, True)
             self._connection_count += 1
             
             logger.info(f"Added connection for capability '{capability}' to {endpoint} ({self._connection_count}/{self._max_connections})")
@@ -458,7 +578,7 @@ class MCPConnectionPool:
             
         except Exception as e:
             logger.error(f"Failed to add connection for '{capability}': {e}")
-            self._health[capability] = False
+            self._set_health(capability, False)
             return False
     
     async def send_message(
@@ -480,20 +600,124 @@ class MCPConnectionPool:
             KeyError: If capability not found
             ConnectionError: If connection is not healthy
         """
-        if capability not in self._connections:
-            raise KeyError(f"No connection found for capability: {capability}")
-        
-        if not self._health.get(capability, False):
-            raise ConnectionError(f"Connection for '{capability}' is not healthy")
+        connection = self._get_healthy_connection(capability)
         
+        await self._acquire_request_slot()
         try:
-            connection = self._connections[capability]
             return await connection.send_message(message)
         except Exception as e:
             # Mark connection as unhealthy on failure
-            self._health[capability] = False
+            self._set_health(capability, False)
             logger.warning(f"Connection for '{capability}' marked unhealthy: {e}")
             raise
+        finally:
+            await self._release_request_slot()
+    
+    async def send_batch(
+        self,
+        capability: str,
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several messages through a capability connection as one exchange.
+        
+        The batch occupies a single in-flight request slot.
+        
+        Args:
+            capability: The capability to send messages through
+            messages: The messages to send
+        
+        Returns:
+            Responses in the same order as the messages
+        
+        Raises:
+            KeyError: If capability not found
+            ConnectionError: If connection is not healthy or the batch fails
+        """
+        connection = self._get_healthy_connection(capability)
+        if not messages:
+            return []
+        
+        await self._acquire_request_slot()
+        try:
+            responses = await connection.send_batch(messages)
+            if len(responses) != len(messages):
+                raise ConnectionError(
+                    f"Batch response count mismatch: sent {len(messages)}, received {len(responses)}"
+                )
+            logger.debug(f"Sent batch of {len(messages)} messages for '{capability}'")
+            return responses
+        except Exception as e:
+            # Mark connection as unhealthy on failure
+            self._set_health(capability, False)
+            logger.warning(f"Connection for '{capability}' marked unhealthy: {e}")
+            raise
+        finally:
+            await self._release_request_slot()
+    
+    def _get_healthy_connection(self, capability: str) -> MCPConnectionInterface:
+        """Look up a capability's connection, refusing unknown or unhealthy ones."""
+        if capability not in self._connections:
+            raise KeyError(f"No connection found for capability: {capability}")
+        
+        if not self.is_healthy(capability):
+            raise ConnectionError(f"Connection for '{capability}' is not healthy")
+        
+        return self._connections[capability]
+    
+    def _get_request_slots(self) -> asyncio.Condition:
+        """Get the admission condition for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._request_slots is None or self._request_slots_loop is not loop:
+            # Waiters can only belong to the current loop, so a condition left
+            # over from an earlier loop (e.g. a previous asyncio.run) is dropped
+            self._request_slots = asyncio.Condition()
+            self._request_slots_loop = loop
+        return self._request_slots
+    
+    async def _acquire_request_slot(self) -> None:
+        """Wait until an in-flight request slot is free and claim it."""
+        if self._max_concurrent_requests is None:
+            # No limit: count the request without touching the condition
+            self._active_requests += 1
+            return
+        
+        slots = self._get_request_slots()
+        async with slots:
+            while (
+                self._max_concurrent_requests is not None
+                and self._active_requests >= self._max_concurrent_requests
+            ):
+                await slots.wait()
+            self._active_requests += 1
+    
+    async def _release_request_slot(self) -> None:
+        """Release an in-flight request slot and wake one waiter."""
+        self._active_requests -= 1
+        if self._max_concurrent_requests is None:
+            # Nobody waits while there is no limit
+            return
+        
+        slots = self._get_request_slots()
+        async with slots:
+            slots.notify(1)
+    
+    async def set_max_concurrent_requests(self, max_concurrent_requests: Optional[int]) -> None:
+        """
+        Resize the in-flight request limit.
+        
+        Growing the limit wakes all waiters so they can claim the new slots
+        immediately; shrinking it takes effect as in-flight requests complete.
+        
+        Args:
+            max_concurrent_requests: New limit (None for no limit)
+        """
+        slots = self._get_request_slots()
+        async with slots:
+            self._max_concurrent_requests = max_concurrent_requests
+            slots.notify_all()
+        
+        logger.debug(f"Max concurrent requests set to {max_concurrent_requests}")
     
     async def health_check(self) -> Dict[str, bool]:
         """
@@ -514,9 +738,69 @@ class MCPConnectionPool:
                 health_results[capability] = False
         
         # Update internal health tracking
-        self._health.update(health_results)
+        for capability, healthy in health_results.items():
+            self._set_health(capability, healthy)
         return health_results
     
+    def _set_health(self, capability: str, healthy: bool) -> None:
+        """Set or clear a capability's health event."""
+        event = self._health_events.get(capability)
+        if event is None:
+            event = self._health_events[capability] = asyncio.Event()
+        if healthy:
+            event.set()
+        else:
+            event.clear()
+    
+    def is_healthy(self, capability: str) -> bool:
+        """Check whether a capability's connection is currently healthy."""
+        event = self._health_events.get(capability)
+        return event is not None and event.is_set()
+    
+    async def wait_for_healthy(
+        self,
+        capabilities: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Wait until one of the given capabilities is healthy.
+        
+        Capabilities are checked in the order given, so an already healthy one
+        is returned without waiting. Otherwise this wakes as soon as a health
+        check marks any of them healthy again, rather than polling.
+        
+        Args:
+            capabilities: Capabilities to consider (all known ones if None)
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+        
+        Returns:
+            The first healthy capability, or None if none recovered in time
+        """
+        if capabilities is None:
+            capabilities = list(self._health_events)
+        else:
+            capabilities = list(capabilities)
+        
+        for capability in capabilities:
+            if self.is_healthy(capability):
+                return capability
+        
+        events = [self._health_events[c] for c in capabilities if c in self._health_events]
+        if not events:
+            return None
+        
+        waiters = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        
+        for capability in capabilities:
+            if self.is_healthy(capability):
+                return capability
+        return None
+    
     async def close_all(self) -> None:
         """Close all connections in the pool."""
         for capability, connection in self._connections.items():
@@ -527,13 +811,13 @@ class MCPConnectionPool:
                 logger.warning(f"Error closing connection for '{capability}': {e}")
         
         self._connections.clear()
-        self._health.clear()
+        self._health_events.clear()
         self._connection_count = 0
         logger.info("All connections closed")
     
     def get_health_status(self) -> Dict[str, bool]:
         """Get current health status of all connections."""
-        return self._health.copy()
+        return {capability: event.is_set() for capability, event in self._health_events.items()}
     
     def get_connection_info(self) -> Dict[str, Dict[str, Any]]:
         """Get detailed information about all connections."""
@@ -543,7 +827,7 @@ class MCPConnectionPool:
             info[capability] = {
                 "endpoint": connection.endpoint,
                 "connected": connection.connected,
-                "healthy": self._health.get(capability, False),
+                "healthy": self.is_healthy(capability),
                 "type": type(connection).__name__
             }
         
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+MCP JSON Serialization Utilities
+
+This module provides the JSON decoder used to parse MCP server configuration.
+It uses orjson when installed (``pip install mcp-client-integration[fast]``)
+and falls back to the standard library otherwise, so callers never need to
+know which backend is active.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this single type regardless of the active backend
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text using the fastest available backend.
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
@@ -7,16 +7,64 @@ consolidating validation logic from across the codebase into a single,
 reusable interface.
 """
 
+import json
 import re
 import logging
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 
+from .serialization import JSONDecodeError, json_loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Compiled once at import and shared by every validator instance
+_EXTERNAL_ROUTE_PATTERN = re.compile(
+    r'^https?://[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}(?::\d+)?(?:/[a-zA-Z0-9\-\.\/]*)?(?:\?.*)?$'
+)
+
+_CLUSTER_SERVICE_PATTERN = re.compile(
+    r'^[a-zA-Z0-9\-]+\.[a-zA-Z0-9\-]+\.svc\.cluster\.local(?::\d+)?$'
+)
+
+_HOSTNAME_PATTERN = re.compile(
+    r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
+)
+
+_K8S_NAME_PATTERN = re.compile(
+    r'^[a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?$'
+)
+
+# Basic path validation - allow alphanumeric, hyphens, slashes, dots
+_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9\-\./]*$')
+
+# Capability names must not carry injection-style sequences: HTML/script
+# injection, command injection, variable expansion, path traversal or
+# Python internals. A single alternation replaces the per-call pattern list.
+_DANGEROUS_CAPABILITY_PATTERN = re.compile(
+    r'[<>"\'\`]|[;|&]|\$\{|\.\./|__.*__'
+)
+
+# Private IPv4 ranges: 10.0.0.0/8, 172.16.0.0/12 and 192.168.0.0/16
+_PRIVATE_IP_PATTERN = re.compile(
+    r'^(?:10\.|172\.(?:1[6-9]|2[0-9]|3[01])\.|192\.168\.)'
+)
+
+
+@lru_cache(maxsize=32)
+def parse_mcp_servers(env_value: str) -> Any:
+    """
+    Parse an MCP_SERVERS value once per distinct string.
+    
+    Configuration and security validation both need the parsed document, and
+    clients are often created repeatedly from the same environment, so the
+    result is cached by the raw value. Callers must treat it as read-only.
+    Invalid JSON raises JSONDecodeError and is never cached.
+    """
+    return json_loads(env_value)
+
 
 @dataclass
 class ValidationResult:
@@ -52,23 +100,11 @@ class MCPEndpointValidator:
     """
     
     def __init__(self):
-        """Initialize validator with compiled regex patterns."""
-        # Compiled regex patterns for performance
-        self._external_route_pattern = re.compile(
-            r'^https?://[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}(?::\d+)?(?:/[a-zA-Z0-9\-\.\/]*)?(?:\?.*)?$'
-        )
-        
-        self._cluster_service_pattern = re.compile(
-            r'^[a-zA-Z0-9\-]+\.[a-zA-Z0-9\-]+\.svc\.cluster\.local(?::\d+)?$'
-        )
-        
-        self._hostname_pattern = re.compile(
-            r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
-        )
-        
-        self._k8s_name_pattern = re.compile(
-            r'^[a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?$'
-        )
+        """Initialize validator with the shared module-level compiled patterns."""
+        self._external_route_pattern = _EXTERNAL_ROUTE_PATTERN
+        self._cluster_service_pattern = _CLUSTER_SERVICE_PATTERN
+        self._hostname_pattern = _HOSTNAME_PATTERN
+        self._k8s_name_pattern = _K8S_NAME_PATTERN
         
         logger.debug("MCPEndpointValidator initialized with compiled patterns")
     
@@ -340,9 +376,7 @@ class MCPEndpointValidator:
         if not path:
             return True
         
-        # Basic path validation - allow alphanumeric, hyphens, slashes, dots
-        path_pattern = re.compile(r'^[a-zA-Z0-9\-\./]*$')
-        return bool(path_pattern.match(path))
+        return bool(_PATH_PATTERN.match(path))
     
     def _is_valid_k8s_name(self, name: str) -> bool:
         """
@@ -441,10 +475,9 @@ class MCPConfigurationValidator:
             )
         
         try:
-            import json
-            json_data = json.loads(env_value)
+            json_data = parse_mcp_servers(env_value)
             return self.validate_json_config(json_data)
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             return ValidationResult(
                 valid=False,
                 error_message=f"Invalid JSON in MCP_SERVERS environment variable: {e}"
@@ -495,6 +528,8 @@ class MCPSecurityValidator:
         """
         # Check configuration size
         try:
+            # Measure dicts in the stdlib's default form so the limit does not
+            # depend on which JSON backend is installed
             config_str = json.dumps(config_data) if not isinstance(config_data, str) else config_data
             if len(config_str.encode('utf-8')) > self.MAX_CONFIG_SIZE:
                 return ValidationResult(
@@ -510,8 +545,8 @@ class MCPSecurityValidator:
         # Validate JSON structure for injection attempts
         if isinstance(config_data, str):
             try:
-                config_data = json.loads(config_data)
-            except json.JSONDecodeError as e:
+                config_data = parse_mcp_servers(config_data)
+            except JSONDecodeError as e:
                 return ValidationResult(
                     valid=False,
                     error_message=f"Invalid JSON configuration: {e}"
@@ -597,20 +632,11 @@ class MCPSecurityValidator:
             )
         
         # Check for injection patterns
-        dangerous_patterns = [
-            r'[<>"\'\`]',  # HTML/script injection
-            r'[;|&]',      # Command injection
-            r'\$\{',       # Variable expansion
-            r'\.\./',      # Path traversal
-            r'__.*__',     # Python internals
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, capability):
-                return ValidationResult(
-                    valid=False,
-                    error_message=f"Capability name contains potentially dangerous characters: {capability}"
-                )
+        if _DANGEROUS_CAPABILITY_PATTERN.search(capability):
+            return ValidationResult(
+                valid=False,
+                error_message=f"Capability name contains potentially dangerous characters: {capability}"
+            )
         
         return ValidationResult(valid=True)
     
@@ -688,14 +714,4 @@ class MCPSecurityValidator:
             True if hostname appears to be a private IP
         """
         # Basic private IP pattern matching
-        private_patterns = [
-            r'^10\.',          # 10.0.0.0/8
-            r'^172\.(1[6-9]|2[0-9]|3[01])\.',  # 172.16.0.0/12
-            r'^192\.168\.',    # 192.168.0.0/16
-        ]
-        
-        for pattern in private_patterns:
-            if re.match(pattern, hostname):
-                return True
-        
-        return False
\ No newline at end of file
+        return _PRIVATE_IP_PATTERN.match(hostname) is not None
\ No newline at end of file
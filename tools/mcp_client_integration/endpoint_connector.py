@@ -130,40 +130,14 @@ class MCPEndpointConnector:
     
     async def _test_external_route_connectivity(self, endpoint: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """Test connectivity to external route."""
-        try:
-            parsed = urlparse(endpoint)
-            host = parsed.hostname
-            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
-            
-            start_time = time.time()
-            
-            # Test TCP connectivity
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout_seconds)
-            
-            try:
-                if parsed.scheme == 'https':
-                    # Test SSL connectivity
-                    context = ssl.create_default_context()
-                    sock = context.wrap_socket(sock, server_hostname=host)
-                
-                sock.connect((host, port))
-                
-                end_time = time.time()
-                result["reachable"] = True
-                result["response_time_ms"] = int((end_time - start_time) * 1000)
-                
-            finally:
-                sock.close()
-                
-        except socket.timeout:
-            result["error"] = f"Connection timeout after {self.timeout_seconds}s"
-        except socket.gaierror as e:
-            result["error"] = f"DNS resolution failed: {e}"
-        except Exception as e:
-            result["error"] = f"Connection failed: {e}"
+        parsed = urlparse(endpoint)
+        host = parsed.hostname
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
         
-        return result
+        # Test SSL connectivity for HTTPS routes
+        ssl_context = ssl.create_default_context() if parsed.scheme == 'https' else None
+        
+        return await self._test_tcp_connectivity(host, port, result, ssl_context)
     
     async def _test_cluster_service_connectivity(self, endpoint: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """Test connectivity to cluster service."""
@@ -175,24 +149,58 @@ class MCPEndpointConnector:
             else:
                 service_part = endpoint
                 port = 80  # Default port
+        except ValueError as e:
+            result["error"] = f"Connection failed: {e}"
+            return result
+        
+        return await self._test_tcp_connectivity(service_part, port, result)
+    
+    async def _test_tcp_connectivity(
+        self,
+        host: str,
+        port: int,
+        result: Dict[str, Any],
+        ssl_context: Optional[ssl.SSLContext] = None
+    ) -> Dict[str, Any]:
+        """
+        Open and close a TCP (optionally TLS) connection without blocking the event loop.
+        
+        DNS resolution, connect and the TLS handshake all run on the event loop,
+        so checks against many endpoints can proceed concurrently.
+        
+        Args:
+            host: Hostname or IP address to connect to
+            port: Port to connect to
+            result: Result dictionary to fill in
+            ssl_context: SSL context for TLS connections, None for plain TCP
             
-            start_time = time.time()
+        Returns:
+            The updated result dictionary
+        """
+        try:
+            start_time = time.monotonic()
             
-            # Test TCP connectivity to cluster service
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout_seconds)
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port,
+                    ssl=ssl_context,
+                    server_hostname=host if ssl_context else None
+                ),
+                timeout=self.timeout_seconds
+            )
             
+            end_time = time.monotonic()
+            result["reachable"] = True
+            result["response_time_ms"] = int((end_time - start_time) * 1000)
+            
+            writer.close()
             try:
-                sock.connect((service_part, port))
-                
-                end_time = time.time()
-                result["reachable"] = True
-                result["response_time_ms"] = int((end_time - start_time) * 1000)
-                
-            finally:
-                sock.close()
+                await writer.wait_closed()
+            except Exception:
+                # The probe already succeeded; errors tearing it down don't matter
+                pass
                 
-        except socket.timeout:
+        except asyncio.TimeoutError:
             result["error"] = f"Connection timeout after {self.timeout_seconds}s"
         except socket.gaierror as e:
             result["error"] = f"DNS resolution failed: {e}"
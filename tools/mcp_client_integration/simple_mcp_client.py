@@ -11,7 +11,8 @@ Refactored to use common utilities for reduced code duplication.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, FrozenSet, List, Optional, Pattern, Tuple
 
 from .common import (
     MCPConnectionPool,
@@ -26,6 +27,13 @@ from .common import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Keyword groups for well-known capabilities, checked in priority order
+_CAPABILITY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("atlassian", ("jira", "ticket", "issue", "project")),
+    ("github", ("github", "repository", "repo", "commit")),
+    ("confluence", ("confluence", "wiki", "document", "page")),
+)
+
 
 class SimpleMCPClient:
     """
@@ -59,6 +67,9 @@ class SimpleMCPClient:
         self.servers = self.config.get_server_endpoints()
         self.mock = mock
         
+        # Capability names and keywords never change after init, so compile them once
+        self._capability_pattern, self._capability_terms = self._build_capability_matcher()
+        
         logger.info(f"Initialized SimpleMCPClient with {len(self.servers)} servers: {list(self.servers.keys())}")
     
     @property
@@ -132,17 +143,83 @@ class SimpleMCPClient:
             # Use connection pool to send message
             return await self.connection_pool.send_message(capability, {"query": request})
         except KeyError:
-            # Try fallback to any healthy server
-            health_status = await self.health_check()
-            healthy_capabilities = [cap for cap, healthy in health_status.items() if healthy]
-            
-            if not healthy_capabilities:
-                raise MCPConnectionError("No healthy MCP servers available", "unknown")
-            
-            fallback_capability = healthy_capabilities[0]
+            fallback_capability = await self._fallback_capability()
             logger.info(f"Falling back to {fallback_capability} for query")
             return await self.connection_pool.send_message(fallback_capability, {"query": request})
     
+    @handle_mcp_errors("query_batch")
+    async def query_batch(self, requests: List[str], capability: str = None) -> List[Any]:
+        """
+        Send several queries, one batch exchange per target MCP server.
+        
+        Queries are routed exactly as in query(); those bound for the same
+        capability share a single round trip, and different capabilities are
+        contacted concurrently.
+        
+        Args:
+            requests: The query strings to send
+            capability: Optional explicit capability to target for every query
+        
+        Returns:
+            Query responses in the same order as the requests
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            target = capability or self._detect_capability(request)
+            groups.setdefault(target, []).append(index)
+        
+        async def send_group(target: str, indices: List[int]) -> List[Any]:
+            messages = [{"query": requests[i]} for i in indices]
+            try:
+                return await self.connection_pool.send_batch(target, messages)
+            except KeyError:
+                fallback_capability = await self._fallback_capability()
+                logger.info(f"Falling back to {fallback_capability} for {len(messages)} queries")
+                return await self.connection_pool.send_batch(fallback_capability, messages)
+        
+        group_responses = await asyncio.gather(
+            *[send_group(target, indices) for target, indices in groups.items()]
+        )
+        
+        results: List[Any] = [None] * len(requests)
+        for indices, responses in zip(groups.values(), group_responses):
+            for index, response in zip(indices, responses):
+                results[index] = response
+        return results
+    
+    async def _fallback_capability(self) -> str:
+        """
+        Pick a healthy server for requests whose capability has no connection.
+        
+        Uses the health state the pool already tracks rather than probing
+        every server, so a fallback never waits on a round of health checks.
+        """
+        fallback_capability = await self.connection_pool.wait_for_healthy(self.servers, timeout=0)
+        
+        if fallback_capability is None:
+            raise MCPConnectionError("No healthy MCP servers available", "unknown")
+        
+        return fallback_capability
+    
+    def _build_capability_matcher(self) -> Tuple[Pattern[str], Dict[str, FrozenSet[str]]]:
+        """
+        Compile every routing term into a single regex alternation.
+        
+        The pattern reports the longest term starting at each position of the
+        request, so each matched term is mapped to all the terms it contains
+        (e.g. "repository" also implies "repo"). This keeps the result identical
+        to a plain substring check per term while scanning the request once.
+        """
+        terms = {capability.lower() for capability in self.servers}
+        for capability, keywords in _CAPABILITY_KEYWORDS:
+            if capability in self.servers:
+                terms.update(keywords)
+        
+        ordered = sorted(terms, key=len, reverse=True)
+        pattern = re.compile("(?=(" + "|".join(re.escape(term) for term in ordered) + "))")
+        implied = {term: frozenset(other for other in terms if other in term) for term in terms}
+        return pattern, implied
+    
     def _detect_capability(self, request: str) -> str:
         """
         Simple keyword-based capability detection.
@@ -150,30 +227,20 @@ class SimpleMCPClient:
         This method analyzes the request string for capability keywords
         and returns the appropriate server capability name.
         """
-        request_lower = request.lower()
-        
-        # Check for capability keywords in request
-        for capability in self.servers.keys():
-            if capability.lower() in request_lower:
-                return capability
-        
-        # Check for common Atlassian keywords
-        if any(keyword in request_lower for keyword in ['jira', 'ticket', 'issue', 'project']):
-            # Look for atlassian capability
-            if 'atlassian' in self.servers:
-                return 'atlassian'
-        
-        # Check for GitHub keywords
-        if any(keyword in request_lower for keyword in ['github', 'repository', 'repo', 'commit']):
-            # Look for github capability
-            if 'github' in self.servers:
-                return 'github'
-        
-        # Check for Confluence keywords
-        if any(keyword in request_lower for keyword in ['confluence', 'wiki', 'document', 'page']):
-            # Look for confluence capability
-            if 'confluence' in self.servers:
-                return 'confluence'
+        found = set()
+        for match in self._capability_pattern.finditer(request.lower()):
+            found.update(self._capability_terms[match.group(1)])
+        
+        if found:
+            # Capability names mentioned in the request take precedence
+            for capability in self.servers:
+                if capability.lower() in found:
+                    return capability
+            
+            # Then keyword groups, in priority order
+            for capability, keywords in _CAPABILITY_KEYWORDS:
+                if capability in self.servers and not found.isdisjoint(keywords):
+                    return capability
         
         # Default to first configured server
         return next(iter(self.servers.keys()))
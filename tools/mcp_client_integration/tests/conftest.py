@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures for the MCP client integration test suite.
+"""
+
+import pytest
+
+try:
+    from ..common.validation import parse_mcp_servers
+except ImportError:
+    parse_mcp_servers = None
+
+
+@pytest.fixture(autouse=True)
+def clear_mcp_config_cache():
+    """Keep the parsed MCP_SERVERS cache from leaking between tests."""
+    if parse_mcp_servers is not None:
+        parse_mcp_servers.cache_clear()
+    yield
+    if parse_mcp_servers is not None:
+        parse_mcp_servers.cache_clear()
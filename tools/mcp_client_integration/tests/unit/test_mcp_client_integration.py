@@ -4,66 +4,69 @@ Test suite for US-001: MCP Client Integration
 
 This test suite validates all acceptance criteria for MCP client integration
 with llama index deployments. Based on SPIKE-001 and SPIKE-002 validated patterns.
+
+Async tests rely on pytest-asyncio auto mode (configured in pyproject.toml), and
+every test is independent, so the module can run in parallel with pytest-xdist:
+
+    pytest -n auto tests/unit/test_mcp_client_integration.py
 """
 
 import pytest
 import asyncio
 import json
-import os
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from typing import Dict, Any, List
 import tempfile
 
-# Test imports - using relative imports for package structure
+# Test imports - using relative imports for package structure. If the package
+# cannot be imported the whole module is skipped at collection time.
 try:
     from ...simple_mcp_client import SimpleMCPClient
     from ...endpoint_connector import MCPEndpointConnector
     from ...llama_integration import MCPEnhancedLlamaIndex
-except ImportError:
-    # Tests will initially fail - this is expected in TDD
-    SimpleMCPClient = None
-    MCPEndpointConnector = None
-    MCPEnhancedLlamaIndex = None
+    from ...common import MCPConnectionPool, MCPConnectionFactory, MockMCPConnection, ExternalRouteMCPConnection, MCPSecurityValidator
+    from ...common import serialization
+except ImportError as e:
+    pytest.skip(f"MCP client integration not importable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def atlassian_client(monkeypatch):
+    """SimpleMCPClient configured with a single Atlassian server"""
+    monkeypatch.setenv("MCP_SERVERS", '{"atlassian": "https://test.com/sse"}')
+    return SimpleMCPClient()
+
+
+@pytest.fixture
+def created_connections(monkeypatch):
+    """Record every connection the factory creates, keyed by endpoint"""
+    created = {}
+    create_connection = MCPConnectionFactory.create_connection
+
+    def recording_create_connection(endpoint, *args, **kwargs):
+        connection = create_connection(endpoint, *args, **kwargs)
+        created[endpoint] = connection
+        return connection
+    
+    monkeypatch.setattr(MCPConnectionFactory, "create_connection", staticmethod(recording_create_connection))
+    return created
 
 
 class TestMCPClientLibraryIntegration:
-    """Test AC-001: MCP Client Library Integration"""
-
-    def test_mcp_client_import(self):
-        """Test MCP client can be imported without errors"""
-        # This test validates the basic import structure
-        assert SimpleMCPClient is not None, "SimpleMCPClient should be importable"
-
-    def test_simple_mcp_client_initialization(self):
-        """Test SimpleMCPClient can be initialized"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        with patch.dict(os.environ, {'MCP_SERVERS': '{"atlassian": "https://test.com/sse"}'}):
-            client = SimpleMCPClient()
-            assert hasattr(client, 'servers')
-            assert hasattr(client, 'connections')
-            assert hasattr(client, 'health')
-
-    def test_sse_connection_capability(self):
-        """Test client can establish SSE connection capability"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        with patch.dict(os.environ, {'MCP_SERVERS': '{"atlassian": "https://test.com/sse"}'}):
-            client = SimpleMCPClient()
-            # Test that client has connection methods
-            assert hasattr(client, 'connect_all')
-            assert hasattr(client, 'connection_pool')  # Uses connection pool now
-
-    def test_protocol_handshake_support(self):
-        """Test client handles MCP protocol handshake"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        # This will test the protocol compliance once implemented
-        client = SimpleMCPClient()
-        assert hasattr(client, 'query')  # Main query interface
+    """Test AC-001 and AC-003: MCP Client Library Integration and Protocol Compliance"""
+
+    @pytest.mark.parametrize("attr", [
+        "servers",             # Configured server endpoints
+        "connections",         # Connection pool info
+        "health",              # Health tracking for routing
+        "config",              # Configuration object
+        "connect_all",         # SSE connection establishment
+        "connection_pool",     # Message handling via connection pool
+        "query",               # Main query, tool discovery and error handling interface
+        "_detect_capability",  # Capability routing
+    ])
+    def test_client_surface(self, attr, atlassian_client):
+        """Test SimpleMCPClient exposes the expected client interface"""
+        assert hasattr(atlassian_client, attr)
 
 
 class TestBasicConnectivityValidation:
@@ -71,177 +74,302 @@ class TestBasicConnectivityValidation:
 
     def test_external_route_connection_support(self):
         """Test support for external route connections"""
-        if MCPEndpointConnector is None:
-            pytest.skip("MCPEndpointConnector not implemented yet")
-        
         connector = MCPEndpointConnector()
         # Test external route format validation
         assert connector.validate_endpoint_config("https://mcp-route.apps.cluster.com/sse")
 
     def test_cluster_service_connection_support(self):
         """Test support for cluster-internal service connections"""
-        if MCPEndpointConnector is None:
-            pytest.skip("MCPEndpointConnector not implemented yet")
-        
         connector = MCPEndpointConnector()
         # Test cluster service format validation
         assert connector.validate_endpoint_config("mcp-atlassian.namespace.svc.cluster.local:8000")
 
     def test_invalid_endpoint_rejection(self):
         """Test invalid endpoints are properly rejected"""
-        if MCPEndpointConnector is None:
-            pytest.skip("MCPEndpointConnector not implemented yet")
-        
         connector = MCPEndpointConnector()
         # Test invalid formats are rejected
         assert not connector.validate_endpoint_config("invalid-format")
         assert not connector.validate_endpoint_config("")
         assert not connector.validate_endpoint_config("ftp://invalid.com")
 
-    def test_connection_timeout_configuration(self):
-        """Test connection timeout configuration (30 second default)"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
+    async def test_concurrent_connectivity_checks_nonblocking(self, monkeypatch):
+        """Test connectivity checks overlap on the event loop instead of running serially"""
+        delay = 0.05
+        in_flight = 0
+        peak = 0
         
-        with patch.dict(os.environ, {'MCP_SERVERS': '{"atlassian": "https://test.com/sse"}'}):
-            client = SimpleMCPClient()
-            # Verify timeout configuration exists in config
-            assert hasattr(client, 'config')  # Should have configuration object
-            assert client.config.default_timeout == 30  # Default timeout
-
-
-class TestProtocolCompliance:
-    """Test AC-003: Protocol Compliance"""
+        class ProbeWriter:
+            def close(self):
+                pass
 
-    def test_mcp_tool_discovery_implementation(self):
-        """Test client implements MCP specification for tool discovery"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
+            async def wait_closed(self):
+                pass
         
-        client = SimpleMCPClient()
-        # Test tool discovery capability
-        assert hasattr(client, 'query')  # Should support tool discovery queries
-
-    def test_message_format_support(self):
-        """Test supports MCP message format for request/response cycles"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        # This will test message format compliance
-        with patch.dict(os.environ, {'MCP_SERVERS': '{"atlassian": "https://test.com/sse"}'}):
-            client = SimpleMCPClient()
-            # Verify message handling exists through connection pool
-            assert hasattr(client, 'connection_pool')
-
-    def test_error_response_handling(self):
-        """Test handles MCP error responses according to specification"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        # Test error handling patterns
-        client = SimpleMCPClient()
-        # Should have error handling in query method
-        assert hasattr(client, 'query')
-
-    def test_message_correlation_ids(self):
-        """Test implements proper message sequencing and correlation IDs"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
+        async def slow_open_connection(host, port, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delay)
+            in_flight -= 1
+            return None, ProbeWriter()
+        
+        monkeypatch.setattr(asyncio, "open_connection", slow_open_connection)
+        connector = MCPEndpointConnector(timeout_seconds=5)
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(*[
+            connector.test_connectivity("http://mcp-route.apps.cluster.com/sse")
+            for _ in range(10)
+        ])
+        elapsed = loop.time() - start
         
-        # Test correlation ID handling
+        assert all(r["reachable"] for r in results), results
+        assert all(r["error"] is None for r in results)
+        # All ten probes were pending at once, so the batch took about one delay, not ten
+        assert peak == 10
+        assert elapsed < 5 * delay
+
+    def test_connection_timeout_configuration(self, monkeypatch):
+        """Test connection timeout configuration (30 second default)"""
+        monkeypatch.setenv("MCP_SERVERS", '{"atlassian": "https://test.com/sse"}')
         client = SimpleMCPClient()
-        # Should support correlation in async operations
-        assert hasattr(client, 'query')
+        # Verify timeout configuration exists in config
+        assert hasattr(client, 'config')  # Should have configuration object
+        assert client.config.default_timeout == 30  # Default timeout
 
 
 class TestMultiMCPServerConfiguration:
     """Test AC-004: Multi-MCP Server Configuration"""
 
-    def test_multiple_mcp_server_support(self):
+    def test_multiple_mcp_server_support(self, monkeypatch):
         """Test configure multiple MCP servers for llama index integration"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         config = json.dumps({
             "atlassian": "https://mcp-atlassian.com/sse",
             "github": "https://mcp-github.com/sse",
             "confluence": "mcp-confluence.namespace.svc.cluster.local:8000"
         })
         
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            assert len(client.servers) == 3
-            assert "atlassian" in client.servers
-            assert "github" in client.servers
-            assert "confluence" in client.servers
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        assert len(client.servers) == 3
+        assert "atlassian" in client.servers
+        assert "github" in client.servers
+        assert "confluence" in client.servers
 
-    def test_json_configuration_parsing(self):
+    def test_json_configuration_parsing(self, monkeypatch):
         """Test JSON-based multi-server configuration via environment variables"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         config = '{"atlassian": "https://test.com/sse"}'
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            assert "atlassian" in client.servers
-            assert client.servers["atlassian"] == "https://test.com/sse"
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        assert "atlassian" in client.servers
+        assert client.servers["atlassian"] == "https://test.com/sse"
+
+    def test_large_configuration_parsing(self, monkeypatch):
+        """Test a maximum-size multi-server configuration parses completely"""
+        servers = {
+            f"server-{i}": f"https://mcp-server-{i}.apps.cluster.com/sse"
+            for i in range(50)
+        }
+        monkeypatch.setenv("MCP_SERVERS", json.dumps(servers))
+        client = SimpleMCPClient()
+        assert client.servers == servers
 
-    def test_configuration_validation_on_startup(self):
-        """Test validate all MCP server configurations on startup with clear error messages"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_codec_backends(self, use_orjson, monkeypatch):
+        """Test the JSON decoder gives identical results with and without orjson"""
+        if use_orjson and serialization.orjson is None:
+            pytest.skip("orjson not installed")
         
+        document = {"atlassian": "https://test.com/sse", "nested": {"timeout": 30}}
+        monkeypatch.setattr(serialization, "orjson", serialization.orjson if use_orjson else None)
+        assert serialization.json_loads(json.dumps(document)) == document
+        with pytest.raises(serialization.JSONDecodeError):
+            serialization.json_loads('{"incomplete": ')
+
+    def test_config_size_limit_independent_of_codec(self):
+        """Test the size limit measures dict configs in stdlib json.dumps form"""
+        validator = MCPSecurityValidator()
+        # Under the limit when compact, over it with json.dumps' default separators
+        servers = {f"k{i:04d}": 0 for i in range(5000)}
+        assert len(json.dumps(servers, separators=(",", ":"))) < validator.MAX_CONFIG_SIZE < len(json.dumps(servers))
+        result = validator.validate_configuration_security(servers)
+        assert not result.valid
+        assert "maximum size" in result.error_message
+
+    def test_configuration_validation_on_startup(self, monkeypatch):
+        """Test validate all MCP server configurations on startup with clear error messages"""
         # Test invalid JSON configuration
-        with patch.dict(os.environ, {'MCP_SERVERS': 'invalid-json'}):
-            with pytest.raises(Exception):  # Should raise clear error
-                SimpleMCPClient()
+        monkeypatch.setenv("MCP_SERVERS", 'invalid-json')
+        with pytest.raises(Exception):  # Should raise clear error
+            SimpleMCPClient()
 
     def test_health_based_routing(self):
         """Test route requests to healthy MCP servers"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         client = SimpleMCPClient()
         # Should have health tracking
         assert hasattr(client, 'health')
         assert hasattr(client, 'query')  # Should support health-based routing
 
 
+class TestMCPConnectionPool:
+    """Test MCPConnectionPool admission control, batching and health tracking"""
+
+    async def test_dynamic_concurrency_resize(self, monkeypatch):
+        """Test in-flight request limit can be resized while requests are waiting"""
+        gate = asyncio.Event()
+        in_flight = 0
+        peak = 0
+        send_message = MockMCPConnection.send_message
+        
+        async def gated_send_message(self, message):
+            # Hold every message until the gate opens
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await gate.wait()
+            in_flight -= 1
+            return await send_message(self, message)
+        
+        monkeypatch.setattr(MockMCPConnection, "send_message", gated_send_message)
+        pool = MCPConnectionPool(max_concurrent_requests=1)
+        assert await pool.add_connection("test", "https://test.com/sse", mock=True)
+        
+        tasks = [asyncio.create_task(pool.send_message("test", {"n": i})) for i in range(3)]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert in_flight == 1
+        
+        # Growing the limit admits the waiting requests without any release
+        await pool.set_max_concurrent_requests(3)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert in_flight == 3
+        
+        gate.set()
+        results = await asyncio.gather(*tasks)
+        assert [r["echo"]["n"] for r in results] == [0, 1, 2]
+        assert peak == 3
+        
+        # Every slot was released: a limit of one still admits a new request
+        await pool.set_max_concurrent_requests(1)
+        response = await asyncio.wait_for(pool.send_message("test", {"n": 3}), timeout=1)
+        assert response["echo"]["n"] == 3
+
+    def test_concurrency_limit_survives_new_event_loop(self, monkeypatch):
+        """Test a limited pool still admits contended requests when reused from another event loop"""
+        send_message = MockMCPConnection.send_message
+
+        async def yielding_send_message(self, message):
+            # Yield so concurrent requests actually contend for the slot
+            await asyncio.sleep(0)
+            return await send_message(self, message)
+        
+        monkeypatch.setattr(MockMCPConnection, "send_message", yielding_send_message)
+        pool = MCPConnectionPool(max_concurrent_requests=1)
+
+        async def burst():
+            if "test" not in pool.get_health_status():
+                assert await pool.add_connection("test", "https://test.com/sse", mock=True)
+            results = await asyncio.gather(*[pool.send_message("test", {"n": i}) for i in range(3)])
+            return [r["echo"]["n"] for r in results]
+        
+        # Each asyncio.run uses a fresh loop, as separate sync callers would
+        assert asyncio.run(burst()) == [0, 1, 2]
+        assert asyncio.run(burst()) == [0, 1, 2]
+
+    async def test_batch_single_exchange(self, monkeypatch, created_connections):
+        """Test batched queries go out as one exchange per capability"""
+        monkeypatch.setenv("MCP_SERVERS", '{"atlassian": "https://mcp-atlassian.com/sse", "github": "https://mcp-github.com/sse"}')
+        client = SimpleMCPClient(mock=True)
+        await client.connect_all()
+        
+        results = await client.query_batch([
+            "Get ticket PROJ-1",
+            "List github repos",
+            "Get ticket PROJ-2"
+        ])
+        
+        # Responses are routed back in request order
+        assert [r["echo"]["query"] for r in results] == [
+            "Get ticket PROJ-1", "List github repos", "Get ticket PROJ-2"
+        ]
+        assert [r["endpoint"] for r in results] == [
+            "https://mcp-atlassian.com/sse", "https://mcp-github.com/sse", "https://mcp-atlassian.com/sse"
+        ]
+        # Batches are per capability: one exchange each, not one per query
+        assert created_connections["https://mcp-atlassian.com/sse"].exchange_count == 1
+        assert created_connections["https://mcp-github.com/sse"].exchange_count == 1
+        assert await client.connection_pool.send_batch("github", []) == []
+
+    async def test_correlation_ids_are_monotonic(self):
+        """Test correlation IDs are small ints counting up per connection"""
+        first = MockMCPConnection("https://first.com/sse")
+        second = MockMCPConnection("https://second.com/sse")
+        
+        ids = [(await first.send_message({"n": i}))["message_id"] for i in range(3)]
+        ids += [r["message_id"] for r in await first.send_batch([{"n": 3}, {"n": 4}])]
+        assert ids == [1, 2, 3, 4, 5]
+        
+        # Each connection has its own sequence
+        assert (await second.send_message({"n": 0}))["message_id"] == 1
+        
+        route = ExternalRouteMCPConnection("https://route.com/sse")
+        await route.connect()
+        assert (await route.send_message({"n": 0}))["id"] == 1
+        batch = await route.send_batch([{"n": 1}, {"n": 2}])
+        assert [r["id"] for r in batch] == [2, 3]
+        assert [r["message"]["n"] for r in batch] == [1, 2]
+
+    async def test_wait_for_healthy_wakes_on_recovery(self, created_connections):
+        """Test waiters wake when a health check marks a server healthy again"""
+        pool = MCPConnectionPool()
+        assert await pool.add_connection("atlassian", "https://mcp-atlassian/sse", mock=True)
+        assert await pool.add_connection("github", "https://mcp-github/sse", mock=True)
+        assert await pool.wait_for_healthy(["github", "atlassian"]) == "github"
+        
+        for connection in created_connections.values():
+            connection.set_failure_mode(True)
+        assert await pool.health_check() == {"atlassian": False, "github": False}
+        assert pool.get_health_status() == {"atlassian": False, "github": False}
+        assert await pool.wait_for_healthy(timeout=0.01) is None
+        
+        waiter = asyncio.create_task(pool.wait_for_healthy())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        created_connections["https://mcp-github/sse"].set_failure_mode(False)
+        await pool.health_check()
+        assert await asyncio.wait_for(waiter, timeout=1) == "github"
+        assert pool.get_health_status() == {"atlassian": False, "github": True}
+
+
 class TestConfigurationFormatSupport:
     """Test AC-005: Configuration Format Support"""
 
-    def test_simple_format_single_server(self):
+    def test_simple_format_single_server(self, monkeypatch):
         """Test single MCP server via MCP_ENDPOINT"""
         # Note: Based on US-001 enhancement, we're using simplified JSON approach
         # This test validates the single server case using JSON format
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         config = '{"default": "https://server/sse"}'
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            assert "default" in client.servers
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        assert "default" in client.servers
 
-    def test_multi_server_json_configuration(self):
+    def test_multi_server_json_configuration(self, monkeypatch):
         """Test multiple servers via MCP_SERVERS JSON environment variable"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         config = json.dumps({
             "atlassian": "https://mcp-atlassian-route.apps.cluster.com/sse",
             "github": "https://mcp-github-route.apps.cluster.com/sse"
         })
         
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            assert len(client.servers) == 2
-            assert client.servers["atlassian"] == "https://mcp-atlassian-route.apps.cluster.com/sse"
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        assert len(client.servers) == 2
+        assert client.servers["atlassian"] == "https://mcp-atlassian-route.apps.cluster.com/sse"
 
     def test_external_route_format_validation(self):
         """Test external route format validation (SPIKE-002 validated)"""
-        if MCPEndpointConnector is None:
-            pytest.skip("MCPEndpointConnector not implemented yet")
-        
         connector = MCPEndpointConnector()
         # Test SPIKE-002 validated external route formats
         assert connector.validate_endpoint_config("https://mcp-route.apps.cluster.com/sse")
@@ -249,9 +377,6 @@ class TestConfigurationFormatSupport:
 
     def test_cluster_service_format_validation(self):
         """Test cluster service format validation (SPIKE-002 validated)"""
-        if MCPEndpointConnector is None:
-            pytest.skip("MCPEndpointConnector not implemented yet")
-        
         connector = MCPEndpointConnector()
         # Test SPIKE-002 validated cluster service formats
         assert connector.validate_endpoint_config("mcp-atlassian.namespace.svc.cluster.local:8000")
@@ -263,44 +388,54 @@ class TestCapabilityRouting:
 
     def test_automatic_capability_detection(self):
         """Test keyword-based capability routing"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         client = SimpleMCPClient()
         # Test capability detection method exists
         assert hasattr(client, '_detect_capability')
 
-    @pytest.mark.asyncio
-    async def test_capability_based_request_routing(self):
+    async def test_capability_based_request_routing(self, monkeypatch):
         """Test requests route to correct servers based on capabilities"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         # Mock multi-server setup
         config = json.dumps({
             "atlassian": "https://mcp-atlassian.com/sse",
             "github": "https://mcp-github.com/sse"
         })
         
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            
-            # Mock connection pool for testing
-            with patch.object(client.connection_pool, 'get_connection_info') as mock_connections, \
-                 patch.object(client.connection_pool, 'get_health_status') as mock_health:
-                
-                mock_connections.return_value = {
-                    "atlassian": {"connected": True, "type": "external_route"},
-                    "github": {"connected": True, "type": "external_route"}
-                }
-                mock_health.return_value = {"atlassian": True, "github": True}
-                
-                # Test capability detection
-                capability = client._detect_capability("Get Jira tickets")
-                assert capability == "atlassian"
-                
-                capability = client._detect_capability("List GitHub repos")
-                assert capability == "github"
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        
+        # Stub connection pool for testing
+        monkeypatch.setattr(client.connection_pool, 'get_connection_info', lambda: {
+            "atlassian": {"connected": True, "type": "external_route"},
+            "github": {"connected": True, "type": "external_route"}
+        })
+        monkeypatch.setattr(
+            client.connection_pool, 'get_health_status', lambda: {"atlassian": True, "github": True}
+        )
+        
+        # Test capability detection
+        capability = client._detect_capability("Get Jira tickets")
+        assert capability == "atlassian"
+        
+        capability = client._detect_capability("List GitHub repos")
+        assert capability == "github"
+
+    def test_capability_detection_overlapping_terms(self, monkeypatch):
+        """Test terms nested inside longer keywords still route by priority"""
+        config = json.dumps({
+            "doc": "https://mcp-doc.com/sse",
+            "github": "https://mcp-github.com/sse",
+            "confluence": "mcp-confluence.namespace.svc.cluster.local:8000"
+        })
+        
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        
+        # "doc" is a configured capability name nested inside "document"
+        assert client._detect_capability("Summarize the design document") == "doc"
+        # Keyword "repo" nested inside "repository"
+        assert client._detect_capability("Show the REPOSITORY layout") == "github"
+        assert client._detect_capability("Update the team wiki") == "confluence"
+        assert client._detect_capability("nothing relevant") == "doc"
 
 
 class TestLlamaIndexIntegration:
@@ -308,18 +443,11 @@ class TestLlamaIndexIntegration:
 
     def test_llama_index_enhanced_class_creation(self):
         """Test enhanced llama index class can be created"""
-        if MCPEnhancedLlamaIndex is None:
-            pytest.skip("MCPEnhancedLlamaIndex not implemented yet")
-        
         # Test creation without initialization
         assert MCPEnhancedLlamaIndex is not None
 
-    @pytest.mark.asyncio
     async def test_enhanced_query_method(self):
         """Test enhanced query method integrates MCP and llama index"""
-        if MCPEnhancedLlamaIndex is None:
-            pytest.skip("MCPEnhancedLlamaIndex not implemented yet")
-        
         # This will test the integration pattern
         enhanced = MCPEnhancedLlamaIndex()
         assert hasattr(enhanced, 'enhanced_query')
@@ -328,26 +456,27 @@ class TestLlamaIndexIntegration:
 class TestDefinitionOfDone:
     """Test Definition of Done criteria"""
 
-    @pytest.mark.asyncio
-    async def test_mcp_client_connects_to_deployed_server(self):
+    async def test_mcp_client_connects_to_deployed_server(self, monkeypatch):
         """Test MCP client successfully connects to deployed MCP Atlassian server"""
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         # This test will validate real connection capability
         config = '{"atlassian": "https://test-mcp-server.com/sse"}'
         
-        with patch.dict(os.environ, {'MCP_SERVERS': config}):
-            client = SimpleMCPClient()
-            
-            # Mock successful connection for test
-            with patch.object(client.connection_pool, 'add_connection', new_callable=AsyncMock) as mock_connect:
-                mock_connect.return_value = True
-                
-                await client.connect_all()
-                # Check health status through the property
-                health_status = await client.health_check()
-                mock_connect.assert_called()
+        monkeypatch.setenv("MCP_SERVERS", config)
+        client = SimpleMCPClient()
+        
+        # Stub successful connection for test
+        calls = []
+        
+        async def add_connection(*args, **kwargs):
+            calls.append(args)
+            return True
+        
+        monkeypatch.setattr(client.connection_pool, 'add_connection', add_connection)
+        
+        await client.connect_all()
+        # Check health status through the property
+        health_status = await client.health_check()
+        assert calls
 
     def test_unit_test_coverage_requirement(self):
         """Test that unit test coverage is >90%"""
@@ -358,22 +487,9 @@ class TestDefinitionOfDone:
     def test_integration_test_validation(self):
         """Test integration test validates end-to-end connectivity"""
         # This test will validate integration testing capability
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
         # Integration test framework should exist
         assert SimpleMCPClient is not None
 
-    def test_error_scenarios_documented(self):
-        """Test error scenarios tested and documented"""
-        # This test ensures error handling is comprehensive
-        if SimpleMCPClient is None:
-            pytest.skip("SimpleMCPClient not implemented yet")
-        
-        # Should have error handling in main methods
-        client = SimpleMCPClient()
-        assert hasattr(client, 'query')  # Should handle errors in query
-
 
 if __name__ == "__main__":
     # Run tests with pytest